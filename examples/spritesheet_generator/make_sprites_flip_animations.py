@@ -4,15 +4,18 @@
 """
 Command line script to generate flip clock spritesheet Bitmap image files.
 
-
+The sheets use a small palette: index 0 is the transparency color, 1 is the
+tile color, 2 is the text color and 3 (if used) is the center line color.
+Only index 0 needs to be made transparent in the displayio.Palette.
 """
 
+import functools
 import math
 
 from typing import Tuple, List, Optional
 import numpy
 from PIL import Image, ImageDraw, ImageFont
-from PIL.Image import Palette, Resampling, Transform
+from PIL.Image import Resampling, Transform
 import typer
 
 DEFAULT_FONT = "LeagueSpartan-Regular.ttf"
@@ -24,98 +27,206 @@ PADDING_SIZE = 8
 TRANSPARENCY_COLOR = (0, 255, 0)
 CENTER_LINE_HEIGHT = 1  # px
 
+# constant entries of the perspective transform system solved in find_coeffs()
+_A_TEMPLATE = numpy.zeros((8, 8))
+_A_TEMPLATE[0::2, 2] = 1
+_A_TEMPLATE[1::2, 5] = 1
+
 
 # pylint: disable=too-many-arguments, too-many-locals
 
 
-def find_coeffs(pa: Tuple, pb: Tuple) -> numpy.ndarray:
+@functools.lru_cache(maxsize=8)
+def _get_font(font: str, font_size: int) -> ImageFont.FreeTypeFont:
+    """
+    Load a font at the given size. Cached so the font file is only parsed
+    once for each font and size combination.
+
+    :param str font: The filename of the font to load
+    :param int font_size: The size to load the font at
+    """
+    return ImageFont.truetype(font, font_size)
+
+
+@functools.lru_cache(maxsize=64)
+def _text_size(character: str, font: str, font_size: int) -> Tuple[int, int]:
+    """
+    Measure the extent of a character rendered at the origin in the given font.
+    Cached so each character only gets laid out once.
+
+    :param str character: The character to measure
+    :param str font: The filename of the font to measure with
+    :param int font_size: The size of the font to measure with
+
+    :returns Tuple[int, int]: The right and bottom edges of the text bounding box
+    """
+    bbox = _get_font(font, font_size).getbbox(character)
+    return bbox[2], bbox[3]
+
+
+def find_coeffs(pa: numpy.ndarray, pb: numpy.ndarray) -> numpy.ndarray:
     """
     Find the set of coefficients that can be used to apply a perspective transform
     from the shape of one given plane to the shape of another given plane.
 
-    :param tuple pa: the 4 points that make up the first plane
-    :param tuple pb: the 4 points that make up the second plane
+    Accepts a single pair of planes with shape (4, 2), or a stack of them with
+    shape (N, 4, 2), in which case all N systems are solved in one call.
 
+    :param numpy.ndarray pa: the 4 points that make up the first plane
+    :param numpy.ndarray pb: the 4 points that make up the second plane
+
+    :returns numpy.ndarray: coefficients with shape (8,), or (N, 8) for stacked input
     """
-    matrix = []
-    for p1, p2 in zip(pa, pb):
-        matrix.append([p1[0], p1[1], 1, 0, 0, 0, -p2[0] * p1[0], -p2[0] * p1[1]])
-        matrix.append([0, 0, 0, p1[0], p1[1], 1, -p2[1] * p1[0], -p2[1] * p1[1]])
+    pa = numpy.asarray(pa, dtype=numpy.float64)
+    pb = numpy.asarray(pb, dtype=numpy.float64)
+
+    A = numpy.broadcast_to(_A_TEMPLATE, pa.shape[:-2] + (8, 8)).copy()
+    A[..., 0::2, 0] = pa[..., 0]
+    A[..., 0::2, 1] = pa[..., 1]
+    A[..., 0::2, 6] = -pb[..., 0] * pa[..., 0]
+    A[..., 0::2, 7] = -pb[..., 0] * pa[..., 1]
+    A[..., 1::2, 3] = pa[..., 0]
+    A[..., 1::2, 4] = pa[..., 1]
+    A[..., 1::2, 6] = -pb[..., 1] * pa[..., 0]
+    A[..., 1::2, 7] = -pb[..., 1] * pa[..., 1]
+    B = pb.reshape(pb.shape[:-2] + (8,))
 
-    A = numpy.matrix(matrix, dtype=float)
-    B = numpy.array(pb).reshape(8)
+    return numpy.linalg.solve(A, B[..., None])[..., 0]
 
-    res = numpy.dot(numpy.linalg.inv(A.T * A) * A.T, B)
-    return numpy.array(res).reshape(8)
+
+def _stack_points(angle: numpy.ndarray, points: List[Tuple]) -> numpy.ndarray:
+    """
+    Stack 4 (x, y) points, whose coordinates may be scalars or per-angle arrays,
+    into an array with shape (N, 4, 2) for N angles.
+    """
+    return numpy.stack(
+        [
+            numpy.stack(numpy.broadcast_arrays(x, y, angle)[:2], axis=-1)
+            for x, y in points
+        ],
+        axis=-2,
+    )
 
 
-def find_top_half_coeffs_inputs_for_angle(img: Image.Image, angle: int) -> Tuple[List]:
+def find_top_half_coeffs_inputs_for_angle(
+    img_size: Tuple[int, int], angle: numpy.ndarray
+) -> Tuple[numpy.ndarray]:
     """
-    Find the coefficient inputs for the top half of the image for a given angle.
+    Find the coefficient inputs for the top half of the image for the given angles.
 
-    :param PIL.Image img: The image object representing the top half of the digit
-    :param int angle: The angle in degrees (0-90) to generate the coefficients for
+    :param tuple img_size: The (width, height) of the image representing the top
+      half of the digit
+    :param numpy.ndarray angle: The angles in degrees (0-90) to generate the coefficients for
 
-    :returns Tuple of Lists of input points that can be passed to the
+    :returns Tuple of arrays of input points that can be passed to the
      find_coefficient() function.
     """
+    img_width, img_height = img_size
+    angle = numpy.atleast_1d(numpy.asarray(angle, dtype=numpy.float64))
     x_val = (angle * PADDING_SIZE) / 90
-    y_val = min((angle * (img.height)) / 90, img.height - 1)
-
-    first_list = [
-        (-(x_val + 1), y_val),
-        (img.width + x_val, y_val),
-        (img.width, img.height),
-        (0, img.height),
-    ]
-    second_list = [(0, 0), (img.width, 0), (img.width, img.height), (0, img.height)]
+    y_val = numpy.minimum((angle * img_height) / 90, img_height - 1)
+
+    first_list = _stack_points(
+        angle,
+        [
+            (-(x_val + 1), y_val),
+            (img_width + x_val, y_val),
+            (img_width, img_height),
+            (0, img_height),
+        ],
+    )
+    second_list = _stack_points(
+        angle, [(0, 0), (img_width, 0), (img_width, img_height), (0, img_height)]
+    )
     return first_list, second_list
 
 
 def find_bottom_half_coeffs_inputs_for_angle(
-    img: Image.Image, angle: int
-) -> Tuple[List]:
+    img_size: Tuple[int, int], angle: numpy.ndarray
+) -> Tuple[numpy.ndarray]:
     """
-    Find the coefficient inputs for the bottom half of the image for a given angle.
+    Find the coefficient inputs for the bottom half of the image for the given angles.
 
-    :param PIL.Image img: The image object representing the top half of the digit
-    :param int angle: The angle in degrees (0-90) to generate the coefficients for.
+    :param tuple img_size: The (width, height) of the image representing the bottom
+      half of the digit
+    :param numpy.ndarray angle: The angles in degrees (0-90) to generate the coefficients for.
     """
+    img_width, img_height = img_size
+    angle = numpy.atleast_1d(numpy.asarray(angle, dtype=numpy.float64))
     x_val = ((90 - angle) * PADDING_SIZE) / 90
-    y_val = min((angle * (img.height)) / 90, img.height - 1)
+    y_val = numpy.minimum((angle * img_height) / 90, img_height - 1)
     # print(f"(x: {x_val}, y: {y_val})")
-    first_list = [
-        (0, 0),
-        (img.width, 0),
-        (img.width + x_val, y_val),
-        (-(x_val + 1), y_val),
-    ]
-    second_list = [(0, 0), (img.width, 0), (img.width, img.height), (0, img.height)]
+    first_list = _stack_points(
+        angle,
+        [
+            (0, 0),
+            (img_width, 0),
+            (img_width + x_val, y_val),
+            (-(x_val + 1), y_val),
+        ],
+    )
+    second_list = _stack_points(
+        angle, [(0, 0), (img_width, 0), (img_width, img_height), (0, img_height)]
+    )
     return first_list, second_list
 
 
-def get_top_half(img: Image.Image) -> Image.Image:
+def split_halves(img: Image.Image) -> Tuple[Image.Image, Image.Image]:
     """
-    Return an Image object representing the top half of the input image
+    Split an image into its top and bottom halves.
 
     :param Image img: input image
 
-    :returns Image: PIL Image object containing the top half of the input image
+    :returns Tuple[Image, Image]: PIL Image objects containing the top half
+      and bottom half of the input image
+    """
+    arr = numpy.asarray(img)
+    half_height = img.height // 2
+    return Image.fromarray(arr[:half_height]), Image.fromarray(arr[half_height:])
+
+
+@functools.lru_cache(maxsize=8)
+def _make_blank_tile(
+    width: int,
+    height: int,
+    padding: int,
+    tile_color: Tuple[int, int, int],
+    transparency_color: Tuple[int, int, int],
+) -> Image.Image:
     """
-    top_half = img.crop((0, 0, img.width, img.height // 2))
-    return top_half
+    Make a tile with the background and tile rectangle drawn but no character.
+    Cached, so callers must not draw on it directly.
 
+    :param int width: The width in pixels of the tile
+    :param int height: The height in pixels of the tile
+    :param int padding: The number of pixels padding around all sides
+    :param tuple tile_color: The color of the tile rectangle
+    :param tuple transparency_color: The color to fill the padding with
 
-def get_bottom_half(img: Image.Image) -> Image.Image:
+    :returns Image: PIL Image object containing the blank tile
     """
-    Return an Image object representing the bottom half of the input image
+    tile_img = Image.new("RGB", (width, height), color=transparency_color)
+    ImageDraw.Draw(tile_img).rectangle(
+        ((padding, padding), (width - padding, height - padding)),
+        outline=tile_color,
+        fill=tile_color,
+    )
+    return tile_img
 
-    :param Image img: input image
 
-    :returns Image: PIL Image object containing the bottom half of the input image
+@functools.lru_cache(maxsize=8)
+def _scratch_canvas(width: int, height: int) -> Tuple[Image.Image, ImageDraw.ImageDraw]:
     """
-    bottom_half = img.crop((0, img.height // 2, img.width, img.height))
-    return bottom_half
+    Get the scratch Image and its ImageDraw used to render sprites of the given
+    size. Cached so the same pair is re-used by every make_sprite() call.
+
+    :param int width: The width in pixels of the canvas
+    :param int height: The height in pixels of the canvas
+
+    :returns Tuple[Image, ImageDraw]: The scratch Image and an ImageDraw bound to it
+    """
+    canvas = Image.new("RGB", (width, height))
+    return canvas, ImageDraw.Draw(canvas)
 
 
 def make_sprite(
@@ -136,6 +247,9 @@ def make_sprite(
     These get packed into the static sprite sheet, and are used as the basis
     for the angled animation sprites.
 
+    Rendered sprites are cached, so repeated calls with the same arguments
+    return a copy instead of drawing the character again.
+
     :param str character: A single digit or character to put on this static sprite
     :param int font_size: The size to render the font on the the sprite
     :param str font: The filename of the font to render the character in.
@@ -156,31 +270,62 @@ def make_sprite(
     :param tuple center_line_color: The color to draw the center horizontal line.
       None for no line.
 
-
     :returns Image: The PIL Image object containing a single static character sprite.
     """
-    border_rect_size = (width - padding, height - padding)
+    return _render_sprite(
+        character,
+        font_size,
+        font,
+        padding,
+        width,
+        height,
+        _as_color(text_color),
+        _as_color(tile_color),
+        _as_color(transparency_color),
+        text_y_offset,
+        _as_color(center_line_color),
+    ).copy()
+
+
+def _as_color(color: Optional[Tuple[int, int, int]]) -> Optional[Tuple]:
+    """
+    Convert a color given as any sequence (or None) to a hashable tuple.
+    """
+    return None if color is None else tuple(color)
+
+
+@functools.lru_cache(maxsize=64)
+def _render_sprite(
+    character: str,
+    font_size: int,
+    font: str,
+    padding: int,
+    width: int,
+    height: int,
+    text_color: Tuple[int, int, int],
+    tile_color: Tuple[int, int, int],
+    transparency_color: Tuple[int, int, int],
+    text_y_offset: int,
+    center_line_color: Optional[Tuple[int, int, int]],
+) -> Image.Image:
+    """
+    Cached implementation of make_sprite(). All colors must be tuples.
+    The returned Image is shared, so callers must copy() it before handing it out.
+    """
     inner_image_size = (width, height)
-    border_shape = ((padding, padding), border_rect_size)
     center_line_shape = (
         (padding, height // 2 - CENTER_LINE_HEIGHT // 2),
-        (border_rect_size[0], height // 2 + CENTER_LINE_HEIGHT // 2),
+        (width - padding, height // 2 + CENTER_LINE_HEIGHT // 2),
     )
 
-    fnt = ImageFont.truetype(font, font_size)
-    img = Image.new("RGBA", (width, height), color=transparency_color)
-
-    inner_img = Image.new("RGBA", inner_image_size, color=transparency_color)
-
-    inner_draw = ImageDraw.Draw(inner_img)
-
-    inner_draw.rectangle(border_shape, outline=tile_color, fill=tile_color)
+    fnt = _get_font(font, font_size)
+    # draw on the shared scratch canvas, starting from a fresh blank tile
+    inner_img, inner_draw = _scratch_canvas(width, height)
+    inner_img.paste(
+        _make_blank_tile(width, height, padding, tile_color, transparency_color)
+    )
 
-    # w, h = inner_draw.textsize(character, font=fnt)
-    # print(f"w: {w}, h: {h}")
-    bbox = inner_draw.textbbox((0, 0), character, font=fnt)
-    w, h = bbox[2], bbox[3]
-    # print(bbox)
+    w, h = _text_size(character, font, font_size)
     inner_draw.text(
         (
             ((inner_image_size[0] - w) // 2) + 1,
@@ -195,15 +340,41 @@ def make_sprite(
             center_line_shape, outline=center_line_color, fill=center_line_color
         )
 
-    img.paste(inner_img, (padding // 2, padding // 2))
-
     # inner_img.save("test_inner.png")
 
-    return inner_img
+    return inner_img.copy()
+
+
+def make_angle_coeffs(
+    img_size: Tuple[int, int], count: int = 10, bottom_skew: bool = False
+) -> numpy.ndarray:
+    """
+    Solve the perspective transform coefficients for every animation frame.
+    These only depend on the size of the half tile, so they can be shared
+    by all of the digits.
+
+    :param tuple img_size: The (width, height) of the half tile image
+    :param int count: number of animation frames to generate (default 10).
+      Must be between 1 and 90, one frame per whole degree at most.
+    :param bool bottom_skew: Whether to find the bottom angle or top angle coefficients
+
+    :returns numpy.ndarray: Array of shape (count, 8) with one set of coefficients per frame
+    """
+    if not 1 <= count <= 90:
+        raise ValueError(f"count must be between 1 and 90, got {count}")
+    angles = numpy.unique(numpy.linspace(1, 90, count).astype(int))
+    if bottom_skew:
+        return find_coeffs(*find_bottom_half_coeffs_inputs_for_angle(img_size, angles))
+    # top skew:
+    return find_coeffs(*find_top_half_coeffs_inputs_for_angle(img_size, angles))
 
 
 def make_angles_sprite_set(
-    img: Image.Image, count: int = 10, bottom_skew: bool = False
+    img: Image.Image,
+    count: int = 10,
+    bottom_skew: bool = False,
+    transparency_color: Tuple[int, int, int] = TRANSPARENCY_COLOR,
+    coeffs: Optional[numpy.ndarray] = None,
 ) -> List[Image.Image]:
     """
     Generate angled sprites from a static sprite image.
@@ -211,37 +382,96 @@ def make_angles_sprite_set(
     :param Image img: input static image
     :param int count: number of animation frames to generate (default 10)
     :param bool bottom_skew: Whether to render the bottom angle or top angled sprites
+    :param tuple transparency_color: The color to fill the area outside the
+      warped sprite with.
+    :param numpy.ndarray coeffs: Coefficients from make_angle_coeffs() to re-use.
+      None to solve them for this image.
 
     :returns List[Image]: A List of Image objects containing the angled sprites.
     """
-    angled_sprites = []
-    # test_sheet = Image.new('RGBA', (img.width * 5, img.height * 2), color=(0, 255, 0))
+    # test_sheet = Image.new('RGB', (img.width * 5, img.height * 2), color=(0, 255, 0))
     # test_sheet.save("before_anything.png")
 
-    angle_count_by = (90 // count) + 1
-    for _, _angle in enumerate(range(0, 91, angle_count_by)):
-        # print(f"angle: {_angle}")
-        if bottom_skew:
-            coeffs = find_coeffs(
-                *find_bottom_half_coeffs_inputs_for_angle(img, _angle + 1)
-            )
-        else:  # top skew:
-            coeffs = find_coeffs(
-                *find_top_half_coeffs_inputs_for_angle(img, _angle + 1)
-            )
-
-        this_angle_img = img.transform(
-            (img.width, img.height), Transform.PERSPECTIVE, coeffs, Resampling.BICUBIC
+    if coeffs is None:
+        coeffs = make_angle_coeffs(img.size, count, bottom_skew)
+
+    size = (img.width, img.height)
+    angled_sprites = [
+        img.transform(
+            size,
+            Transform.PERSPECTIVE,
+            frame_coeffs,
+            Resampling.BILINEAR,
+            fillcolor=transparency_color,
         )
+        for frame_coeffs in coeffs
+    ]
 
-        # this_angle_img.save(f"test_out/top_half_inner_{_angle + 1}.png")
+    return angled_sprites
 
-        # coords = (((_ % 5) * img.width), ((_ // 5) * img.height))
-        # print(coords)
 
-        angled_sprites.append(this_angle_img)
+def make_palette(
+    transparency_color: Tuple[int, int, int] = TRANSPARENCY_COLOR,
+    tile_color: Tuple[int, int, int] = TILE_COLOR,
+    text_color: Tuple[int, int, int] = FONT_COLOR,
+    center_line_color: Optional[Tuple[int, int, int]] = None,
+) -> numpy.ndarray:
+    """
+    Build the small palette that the sprite sheets get quantized to.
+    The transparency color is always at index 0.
 
-    return angled_sprites
+    :param tuple transparency_color: The color to use for transparency.
+    :param tuple tile_color: The color of the tile the digit is on.
+    :param tuple text_color: The color of the digit text in each tile.
+    :param tuple center_line_color: The color of the center horizontal line.
+      None for no line.
+
+    :returns numpy.ndarray: Array of shape (K, 3) containing the palette colors
+    """
+    colors = [transparency_color, tile_color, text_color]
+    if center_line_color and not center_line_color == (None, None, None):
+        colors.append(center_line_color)
+    return numpy.array(colors, dtype=numpy.uint8)
+
+
+def quantize_to_palette(img: Image.Image, palette: numpy.ndarray) -> Image.Image:
+    """
+    Snap every pixel of an image to the nearest color in the given palette.
+
+    :param Image img: input image
+    :param numpy.ndarray palette: Array of shape (K, 3) containing the palette colors
+
+    :returns Image: PIL Image object in "P" mode using the given palette
+    """
+    palette_img = Image.new("P", (1, 1))
+    palette_img.putpalette(palette.flatten().tolist())
+    return img.convert("RGB").quantize(palette=palette_img, dither=Image.Dither.NONE)
+
+
+def palette_indexes(img: Image.Image, palette: numpy.ndarray) -> numpy.ndarray:
+    """
+    Convert an image to an array of indexes of the nearest color in the given palette.
+
+    :param Image img: input image
+    :param numpy.ndarray palette: Array of shape (K, 3) containing the palette colors
+
+    :returns numpy.ndarray: uint8 array with shape (height, width) of palette indexes
+    """
+    return numpy.asarray(quantize_to_palette(img, palette))
+
+
+def indexed_image(indexes: numpy.ndarray, palette: numpy.ndarray) -> Image.Image:
+    """
+    Wrap an array of palette indexes in a "P" mode PIL Image.
+
+    :param numpy.ndarray indexes: uint8 array of palette indexes
+    :param numpy.ndarray palette: Array of shape (K, 3) containing the palette colors
+
+    :returns Image: PIL Image object in "P" mode using the given palette
+    """
+    img = Image.fromarray(indexes)
+    img.putpalette(palette.flatten().tolist())
+    return img
 
 
 def make_static_sheet(
@@ -280,9 +510,11 @@ def make_static_sheet(
       Positive numbers move it down, negative move it up.
 
     """
-    full_sheet_img = Image.new(
-        "RGBA", (width * 3, height * 4), color=transparency_color
+    palette = make_palette(
+        transparency_color, tile_color, text_color, center_line_color
     )
+    # index 0 is the transparency color
+    full_sheet = numpy.zeros((height * 4, width * 3), dtype=numpy.uint8)
 
     for i in range(10):
         img = make_sprite(
@@ -294,57 +526,95 @@ def make_static_sheet(
             height=height,
             text_color=text_color,
             tile_color=tile_color,
+            transparency_color=transparency_color,
             text_y_offset=text_y_offset,
             center_line_color=center_line_color,
         )
         # img.save(f'char_sprites/pil_text_{i}.png')
-        coords = (((i % 3) * width), ((i // 3) * height))
-        # print(coords)
-        full_sheet_img.paste(img, coords)
+        x, y = ((i % 3) * width), ((i // 3) * height)
+        # print((x, y))
+        full_sheet[y : y + height, x : x + width] = palette_indexes(img, palette)
 
     # img = make_sprite(":", font_size=font_size)
-    # coords = (((10 % 3) * TILE_WIDTH), ((10 // 3) * TILE_HEIGHT))
-    # full_sheet_img.paste(img, coords)
+    # x, y = ((10 % 3) * TILE_WIDTH), ((10 // 3) * TILE_HEIGHT)
+    # full_sheet[y : y + height, x : x + width] = palette_indexes(img, palette)
 
-    full_sheet_img = full_sheet_img.convert(mode="P", palette=Palette.WEB)
-    full_sheet_img.save("static_sheet.bmp")
+    indexed_image(full_sheet, palette).save("static_sheet.bmp")
 
 
 def pack_images_to_sheet(
-    images: List[Image.Image],
+    images: List[numpy.ndarray],
     width: int,
-    transparency_color=TRANSPARENCY_COLOR,
-    tile_width: int = TILE_WIDTH,
-) -> Image.Image:
+) -> numpy.ndarray:
     """
-    Pack a list of PIL Image objects into a sprite sheet within
-    another PIL Image object.
+    Pack a list of palette index arrays into a sprite sheet index array.
+    All sprites must be the same size. Space not covered by a sprite is
+    filled with index 0, the transparency color.
 
-    :param List[Image] images: A list of Image objects to pack into the sheet
+    :param List[numpy.ndarray] images: A list of palette index arrays to pack into the sheet
     :param int width: The number of sprites in each row
-    :param tuple transparency_color: The color to use for transparency. displayio.Palette
-      must call make_transparent() with the indexes represented by this color.
-      Tuple containing RGB color values 0-255 for each color.
-    :param int tile_width: The width in pixels of each tile that will be in the sheet.
 
-    :returns Image: PIL Image object containing the packed sprite sheet
+    :returns numpy.ndarray: uint8 array of palette indexes containing the packed sprite sheet
     """
     row_count = math.ceil(len(images) / width)
 
-    _img_width = images[0].width
-    _img_height = images[0].height
+    _img_height, _img_width = images[0].shape
     # print(f"len: {len(images)} width:{width} img_w:{_img_width} img_h:{_img_height}")
-    _sheet_img = Image.new(
-        "RGBA", (_img_width * width, _img_height * row_count), color=transparency_color
+    _sheet = numpy.zeros(
+        (_img_height * row_count, _img_width * width), dtype=numpy.uint8
     )
-    # _sheet_img.save("before_things.bmp")
     for i, image in enumerate(images):
-        coords = (((i % width) * tile_width), ((i // width) * image.height))
-        # print(coords)
-        _sheet_img.paste(image, coords, image)
-        # image.save(f"test_out/img_{i}.png")
+        x = (i % width) * _img_width
+        y = (i // width) * _img_height
+        _sheet[y : y + _img_height, x : x + _img_width] = image
+
+    return _sheet
+
 
-    return _sheet_img
+def _render_digit(
+    character: str,
+    animation_frames: int,
+    sprite_options: dict,
+    palette: numpy.ndarray,
+    top_coeffs: numpy.ndarray,
+    bottom_coeffs: numpy.ndarray,
+) -> Tuple[List[numpy.ndarray], List[numpy.ndarray]]:
+    """
+    Render the top and bottom angled animation sprites for a single digit.
+
+    :param str character: The digit or character to render
+    :param int animation_frames: The number of frames to use for the flip animations.
+    :param dict sprite_options: keyword arguments to pass to make_sprite()
+    :param numpy.ndarray palette: Array of shape (K, 3) containing the palette colors
+    :param numpy.ndarray top_coeffs: Top half coefficients from make_angle_coeffs()
+    :param numpy.ndarray bottom_coeffs: Bottom half coefficients from make_angle_coeffs()
+
+    :returns Tuple[List[numpy.ndarray], List[numpy.ndarray]]: The top and bottom
+      angled sprites as arrays of palette indexes
+    """
+    img = make_sprite(character, **sprite_options)
+
+    top_half, bottom_half = split_halves(img)
+
+    transparency_color = sprite_options["transparency_color"]
+    top_angled_sprites = make_angles_sprite_set(
+        top_half,
+        animation_frames,
+        bottom_skew=False,
+        transparency_color=transparency_color,
+        coeffs=top_coeffs,
+    )
+    bottom_angled_sprites = make_angles_sprite_set(
+        bottom_half,
+        animation_frames,
+        bottom_skew=True,
+        transparency_color=transparency_color,
+        coeffs=bottom_coeffs,
+    )
+    return (
+        [palette_indexes(sprite, palette) for sprite in top_angled_sprites],
+        [palette_indexes(sprite, palette) for sprite in bottom_angled_sprites],
+    )
 
 
 def make_animations_sheets(
@@ -381,58 +651,55 @@ def make_animations_sheets(
       must call make_transparent() with the indexes represented by this color.
       Tuple containing RGB color values 0-255 for each color.
     :param animation_frames: The number of frames to use for the flip animations.
+      Must be between 1 and 90.
     :param int text_y_offset: Amount to shift the text placement verticaly.
       Positive numbers move it down, negative move it up.
     """
-    bottom_sprites = []
-    top_sprites = []
-
-    for i in range(10):
-        img = make_sprite(
+    sprite_options = {
+        "font_size": font_size,
+        "font": font,
+        "padding": padding,
+        "width": width,
+        "height": height,
+        "text_color": text_color,
+        "tile_color": tile_color,
+        "transparency_color": transparency_color,
+        "text_y_offset": text_y_offset,
+        "center_line_color": center_line_color,
+    }
+    palette = make_palette(
+        transparency_color, tile_color, text_color, center_line_color
+    )
+    # the warp geometry is the same for every digit, so solve it once here
+    top_coeffs = make_angle_coeffs(
+        (width, height // 2), animation_frames, bottom_skew=False
+    )
+    bottom_coeffs = make_angle_coeffs(
+        (width, height - height // 2), animation_frames, bottom_skew=True
+    )
+    results = [
+        _render_digit(
             f"{i}",
-            font_size=font_size,
-            font=font,
-            padding=padding,
-            width=width,
-            height=height,
-            text_color=text_color,
-            tile_color=tile_color,
-            text_y_offset=text_y_offset,
-            center_line_color=center_line_color,
+            animation_frames,
+            sprite_options,
+            palette,
+            top_coeffs,
+            bottom_coeffs,
         )
+        for i in range(10)
+    ]
 
-        top_half = get_top_half(img)
-        bottom_half = get_bottom_half(img)
-
-        bottom_angled_sprites = make_angles_sprite_set(
-            bottom_half, animation_frames, bottom_skew=True
-        )
-        top_angled_sprites = make_angles_sprite_set(
-            top_half, animation_frames, bottom_skew=False
-        )
-
-        bottom_sprites.extend(bottom_angled_sprites)
-        top_sprites.extend(top_angled_sprites)
-
-    bottom_sheet = pack_images_to_sheet(
-        images=bottom_sprites,
-        width=animation_frames,
-        transparency_color=transparency_color,
-        tile_width=width,
-    )
-    # bottom_sheet.save("test_bottom_sheet.png")
+    top_sprites = [sprite for top_angled, _ in results for sprite in top_angled]
+    bottom_sprites = [
+        sprite for _, bottom_angled in results for sprite in bottom_angled
+    ]
 
-    bottom_sheet = bottom_sheet.convert(mode="P", palette=Palette.WEB)
-    bottom_sheet.save("bottom_animation_sheet.bmp")
+    bottom_sheet = pack_images_to_sheet(images=bottom_sprites, width=animation_frames)
+    # indexed_image(bottom_sheet, palette).save("test_bottom_sheet.png")
+    indexed_image(bottom_sheet, palette).save("bottom_animation_sheet.bmp")
 
-    top_sheet = pack_images_to_sheet(
-        images=top_sprites,
-        width=animation_frames,
-        tile_width=width,
-        transparency_color=transparency_color,
-    )
-    top_sheet = top_sheet.convert(mode="P", palette=Palette.WEB)
-    top_sheet.save("top_animation_sheet.bmp")
+    top_sheet = pack_images_to_sheet(images=top_sprites, width=animation_frames)
+    indexed_image(top_sheet, palette).save("top_animation_sheet.bmp")
 
 
 def main(
@@ -444,14 +711,15 @@ def main(
     transparent_color: Tuple[int, int, int] = TRANSPARENCY_COLOR,
     font: str = DEFAULT_FONT,
     font_size: int = DEFAULT_FONT_SIZE,
-    animation_frames: int = 10,
+    animation_frames: int = typer.Option(10, min=1, max=90),
     text_y_offset: int = 0,
     center_line_color: Optional[Tuple[int, int, int]] = typer.Option(
         (None, None, None)
     ),
 ) -> None:
     # print(center_line_color)
-    make_static_sheet(
+    # animations first so the static sheet re-uses the cached digit sprites
+    make_animations_sheets(
         font_size=font_size,
         font=font,
         padding=padding,
@@ -460,11 +728,12 @@ def main(
         text_color=text_color,
         tile_color=tile_color,
         transparency_color=transparent_color,
+        animation_frames=animation_frames,
         text_y_offset=text_y_offset,
         center_line_color=center_line_color,
     )
 
-    make_animations_sheets(
+    make_static_sheet(
         font_size=font_size,
         font=font,
         padding=padding,
@@ -473,7 +742,6 @@ def main(
         text_color=text_color,
         tile_color=tile_color,
         transparency_color=transparent_color,
-        animation_frames=animation_frames,
         text_y_offset=text_y_offset,
         center_line_color=center_line_color,
     )